@@ -3,29 +3,180 @@
 Build standalone executable for Mimic using PyInstaller.
 
 Usage:
-    python build_executable.py
+    python build_executable.py [--force] [--clean] [--onefile] [--upx]
 
-This creates a single executable file in dist/mimic that can be run
+The build itself is described by mimic.spec; this script only picks the
+options and runs PyInstaller on it.
+
+PyInstaller's work files are cached under build-cache/<key>, keyed on the
+build options and the Python/PyInstaller versions, so rebuilds after a
+source change are incremental. If the mimic sources haven't changed
+either since the last successful build, PyInstaller is not run at all.
+Pass --force to rebuild anyway, or --clean to also discard the cache and
+build from scratch.
+
+By default this creates a dist/mimic/ folder containing the mimic
+executable, which starts instantly because nothing has to be unpacked.
+Pass --onefile to create a single self-extracting dist/mimic executable
+instead, which is easier to copy to another machine. Both can be run
 without Python installed.
 """
 
+import argparse
+import hashlib
+import importlib
+import importlib.metadata
+import os
+import shutil
 import subprocess
 import sys
 import platform
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Persistent PyInstaller work directories, one per toolchain/options key
+CACHE_DIR = Path("build-cache")
+# PyInstaller spec describing the build
+SPEC_FILE = Path("mimic.spec")
+# Hash of the inputs that produced the current contents of dist/
+HASH_FILE = Path("dist") / ".mimic.buildhash"
+# Bytecode optimization level for the bundle (2 = strip asserts and docstrings)
+OPTIMIZE_LEVEL = "2"
+# Runtime dependencies that must be importable for the bundle to work,
+# by import name -> distribution name (for their installed versions)
+RUNTIME_PACKAGES = {"pynput": "pynput", "PIL": "Pillow", "mss": "mss", "anthropic": "anthropic"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Build standalone executable for Mimic using PyInstaller"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the existing executable is up to date"
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Discard PyInstaller's build cache and rebuild from scratch"
+    )
+    parser.add_argument(
+        "--onefile",
+        action="store_true",
+        help="Build a single self-extracting executable (slower to start)"
+    )
+    parser.add_argument(
+        "--upx",
+        action="store_true",
+        help="Compress binaries with UPX if it is installed (much slower build)"
+    )
+    return parser.parse_args()
+
+
+def compute_build_hashes(cmd, pyinstaller_version):
+    """
+    Hash the inputs that affect the build output.
+
+    Returns (cache_key, build_hash). The cache key covers the PyInstaller
+    command line and the Python/PyInstaller versions, i.e. everything that
+    would make PyInstaller's cached work files unusable. The build hash
+    additionally covers the path and contents of the spec file and every
+    source file in mimic/, and the installed versions of the runtime
+    packages that get bundled, so it changes whenever the executable would.
+    """
+    digest = hashlib.sha256()
+    digest.update("\0".join(cmd).encode())
+    digest.update(f"{sys.version_info[:3]} {pyinstaller_version}".encode())
+    digest.update(f"PYTHONOPTIMIZE={OPTIMIZE_LEVEL}".encode())
+    cache_key = digest.hexdigest()
+
+    for path in [SPEC_FILE, *sorted(Path("mimic").rglob("*.py"))]:
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+
+    # Package metadata only - nothing is imported
+    for distribution in RUNTIME_PACKAGES.values():
+        try:
+            version = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        digest.update(f"{distribution}=={version}".encode())
+
+    return cache_key, digest.hexdigest()
+
+
+def check_import(package):
+    """
+    Import a package and report what went wrong, if anything.
+
+    Returns (package, missing, error). Runs in a worker process so that
+    import side effects (e.g. pynput choosing a backend) stay isolated.
+    """
+    try:
+        importlib.import_module(package)
+    except ModuleNotFoundError as e:
+        if e.name == package:
+            return package, True, str(e)
+        return package, False, str(e)
+    except Exception as e:
+        return package, False, f"{type(e).__name__}: {e}"
+    return package, False, None
+
+
+def check_runtime_packages():
+    """
+    Fail fast if a runtime dependency is missing, before PyInstaller's
+    multi-second analysis would find out. All packages are imported in
+    parallel, one process each.
+    """
+    with ProcessPoolExecutor(max_workers=len(RUNTIME_PACKAGES)) as ex:
+        results = list(ex.map(check_import, RUNTIME_PACKAGES))
+
+    missing = []
+    for package, is_missing, error in results:
+        if is_missing:
+            missing.append(package)
+        elif error:
+            # Installed, but can't initialise here (e.g. pynput without a
+            # display). Anything PyInstaller finds by importing the package -
+            # its hooks' data files and submodules - will be missing from
+            # the bundle, so the result needs testing on a real desktop.
+            print(f"⚠️  {package} is installed but failed to import: {error}")
+            print(f"   Parts of {package} found at import time may be missing from the bundle;")
+            print("   check PyInstaller's log and test the executable on a machine with a display")
+
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
+        print("   Install them with: pip install -e .")
+        sys.exit(1)
+
 
 def main():
+    args = parse_args()
+
     print("🔨 Building Mimic standalone executable...")
     print()
 
-    # Check if PyInstaller is installed
+    # Check if PyInstaller is installed (reads package metadata only, so
+    # PyInstaller itself is never imported into this process)
     try:
-        import PyInstaller
-        print(f"✅ PyInstaller version: {PyInstaller.__version__}")
-    except ImportError:
+        pyinstaller_version = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
         print("📦 Installing PyInstaller...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
+        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller>=6"], check=True)
+        pyinstaller_version = importlib.metadata.version("pyinstaller")
+
+    # Passing options to the spec file after "--" needs PyInstaller 6
+    if int(pyinstaller_version.split(".")[0]) < 6:
+        print(f"❌ PyInstaller {pyinstaller_version} is too old; 6.0 or newer is required")
+        print('   Upgrade with: pip install -U "pyinstaller>=6"')
+        sys.exit(1)
+    print(f"✅ PyInstaller version: {pyinstaller_version}")
+
+    if not SPEC_FILE.exists():
+        print(f"❌ {SPEC_FILE} not found. Run this script from the repository root.")
+        sys.exit(1)
 
     # Determine platform-specific options
     system = platform.system()
@@ -34,61 +185,100 @@ def main():
     if system == "Windows":
         exe_name = "mimic.exe"
 
+    # --onedir puts the executable inside dist/mimic/ alongside its libraries
+    if args.onefile:
+        exe_path = f"dist/{exe_name}"
+    else:
+        exe_path = f"dist/mimic/{exe_name}"
+
     print(f"✅ Platform: {system}")
-    print(f"✅ Output: dist/{exe_name}")
+    print(f"✅ Output: {exe_path}")
     print()
 
-    # Build command
+    # Build command. Options PyInstaller accepts alongside a spec file go
+    # before it; layout options are handed to the spec itself after "--".
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",                    # Single executable
-        "--name", "mimic",              # Output name
-        "--clean",                      # Clean build
         "--noconfirm",                  # Don't ask for confirmation
-        # Hidden imports that PyInstaller might miss
-        "--hidden-import", "pynput.keyboard._xorg",
-        "--hidden-import", "pynput.mouse._xorg",
-        "--hidden-import", "pynput.keyboard._win32",
-        "--hidden-import", "pynput.mouse._win32",
-        "--hidden-import", "pynput.keyboard._darwin",
-        "--hidden-import", "pynput.mouse._darwin",
-        "--hidden-import", "PIL.Image",
-        "--hidden-import", "mss",
-        "--hidden-import", "anthropic",
-        # Entry point
-        "mimic/main.py"
     ]
+    spec_options = []
+
+    if args.onefile:
+        spec_options.append("--onefile")
+
+    # UPX compression is the slowest serial step of a build, so it's opt-in
+    upx = shutil.which("upx") if args.upx else None
+    if upx:
+        cmd += ["--upx-dir", str(Path(upx).parent)]
+        spec_options.append("--upx")
+    elif args.upx:
+        print("⚠️  UPX not found, building without compression")
+
+    cmd += [str(SPEC_FILE), "--", *spec_options]
+
+    # Skip the build entirely if dist/ was produced from identical inputs
+    cache_key, build_hash = compute_build_hashes(cmd, pyinstaller_version)
+    if (not (args.force or args.clean) and Path(exe_path).exists() and HASH_FILE.exists()
+            and HASH_FILE.read_text().strip() == build_hash):
+        print(f"✅ Up to date: {exe_path} (build {build_hash[:12]})")
+        print("   Use --force to rebuild anyway")
+        return
+
+    check_runtime_packages()
+
+    # Reuse the work directory from earlier builds with the same toolchain
+    workpath = CACHE_DIR / cache_key[:16]
+    cmd[3:3] = ["--workpath", str(workpath)]
+
+    if args.clean:
+        cmd.insert(3, "--clean")        # Clean build
+
+    # PyInstaller compiles the bundled modules itself, from source, at the
+    # optimization level of the interpreter running it
+    env = os.environ.copy()
+    env["PYTHONOPTIMIZE"] = OPTIMIZE_LEVEL
 
     print("🔧 Running PyInstaller...")
-    print(f"   Command: {' '.join(cmd)}")
+    print("   Command:", *cmd)
     print()
 
-    result = subprocess.run(cmd)
+    result = subprocess.run(cmd, env=env, check=False)
 
-    if result.returncode == 0:
-        print()
-        print("=" * 50)
-        print("✅ Build successful!")
-        print()
-        print(f"📁 Executable location: dist/{exe_name}")
-        print()
-        print("To use:")
-        if system == "Windows":
-            print("   dist\\mimic.exe start my-task")
-            print("   dist\\mimic.exe compile my-task")
-        else:
-            print("   ./dist/mimic start my-task")
-            print("   ./dist/mimic compile my-task")
-        print()
-        print("To distribute:")
-        print(f"   1. Copy dist/{exe_name} to target machine")
-        print("   2. Set ANTHROPIC_API_KEY environment variable")
-        print("   3. Run!")
-        print("=" * 50)
-    else:
+    if result.returncode:
         print()
         print("❌ Build failed. Check errors above.")
-        sys.exit(1)
+        sys.exit(result.returncode)
+
+    HASH_FILE.write_text(build_hash + "\n")
+
+    if system == "Windows":
+        run_path = exe_path.replace("/", "\\")
+    else:
+        run_path = f"./{exe_path}"
+
+    if args.onefile:
+        copy_step = f"   1. Copy {exe_path} to target machine"
+    else:
+        copy_step = "   1. Copy the whole dist/mimic/ folder to target machine"
+
+    # Written in one go so it doesn't interleave with PyInstaller's output
+    sys.stdout.write("\n".join([
+        "",
+        "=" * 50,
+        "✅ Build successful!",
+        "",
+        f"📁 Executable location: {exe_path}",
+        "",
+        "To use:",
+        f"   {run_path} start my-task",
+        f"   {run_path} compile my-task",
+        "",
+        "To distribute:",
+        copy_step,
+        "   2. Set ANTHROPIC_API_KEY environment variable",
+        "   3. Run!",
+        "=" * 50,
+    ]) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,12 +0,0 @@
-#!/usr/bin/env python3
-"""
-Mimic - Record screen actions and generate automation skills
-
-This is a convenience wrapper. The actual code is in mimic/main.py.
-After pip install, use the 'mimic' command directly.
-"""
-
-from mimic.main import main
-
-if __name__ == '__main__':
-    main()
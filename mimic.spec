@@ -0,0 +1,86 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for the Mimic standalone executable.
+
+Build with `python build_executable.py` rather than running this directly.
+The build script passes these options after `--`:
+
+    --onefile  Single self-extracting executable instead of a dist/mimic/
+               folder
+    --upx      Compress binaries with UPX
+"""
+
+import argparse
+import sys
+
+parser = argparse.ArgumentParser(prog="mimic.spec")
+parser.add_argument("--onefile", action="store_true")
+parser.add_argument("--upx", action="store_true")
+options = parser.parse_args()
+
+# Standard library packages Mimic and its dependencies never import at runtime
+EXCLUDES = ["tkinter", "unittest", "test", "pydoc", "distutils", "lib2to3"]
+
+# Strip debug symbols from bundled binaries (not supported on Windows)
+STRIP = sys.platform != "win32"
+
+# pynput picks its platform backend at runtime, so static analysis can't
+# see it. Listed explicitly rather than with collect_submodules(), which
+# has to import pynput - and that fails without a display (CI, Docker,
+# SSH), silently leaving every backend out. PIL, mss and anthropic are
+# imported directly by mimic/main.py and found by the normal analysis.
+HIDDENIMPORTS = [
+    "pynput.keyboard._xorg",
+    "pynput.mouse._xorg",
+    "pynput._util.xorg",
+    "pynput._util.xorg_keysyms",
+    "pynput.keyboard._win32",
+    "pynput.mouse._win32",
+    "pynput._util.win32",
+    "pynput._util.win32_vks",
+    "pynput.keyboard._darwin",
+    "pynput.mouse._darwin",
+    "pynput._util.darwin",
+    "pynput._util.darwin_vks",
+]
+
+a = Analysis(
+    ["mimic/main.py"],
+    hiddenimports=HIDDENIMPORTS,
+    excludes=EXCLUDES,
+)
+pyz = PYZ(a.pure)
+
+if options.onefile:
+    # Everything packed into dist/mimic, unpacked to a temp dir on launch
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name="mimic",
+        strip=STRIP,
+        upx=options.upx,
+        console=True,
+    )
+else:
+    # dist/mimic/ folder with the executable next to its libraries
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name="mimic",
+        strip=STRIP,
+        upx=options.upx,
+        console=True,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=STRIP,
+        upx=options.upx,
+        name="mimic",
+    )
@@ -4,30 +4,71 @@ Mimic - Record screen actions and generate automation skills
 """
 
 import argparse
-import base64
+import collections
+import contextlib
+import errno
+import functools
+import importlib.util
 import io
 import json
+import math
 import os
-import platform
+import re
+import shutil
+import stat
+import struct
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 
-import anthropic
-import mss
-from PIL import Image, ImageFilter, ImageDraw
-from pynput import mouse, keyboard
+# Pillow and pynput are imported in the functions that use them, like
+# anthropic and mss, so commands that don't record or compile (status,
+# stop, test, install-trigger) start without loading them
 
-# Try to import accessibility libraries (platform-specific)
-ATSPI_AVAILABLE = False
+# Accessibility library (platform-specific). Importing it is slow, so it's
+# only done on first use - see load_atspi()
+Atspi = None
+ATSPI_AVAILABLE = None  # None until load_atspi() has been called
+# libatspi isn't safe to call from several threads at once, and while
+# recording both the mouse listener and the capture loop use it
+ATSPI_LOCK = threading.Lock()
+
+# Use SIMD-accelerated base64 if installed (pip install mimic-moltbot[fast])
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Use orjson for JSON if installed (pip install mimic-moltbot[fast])
 try:
-    import gi
-    gi.require_version('Atspi', '2.0')
-    from gi.repository import Atspi
-    ATSPI_AVAILABLE = True
-except (ImportError, ValueError):
-    pass  # Not available on this system
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False):
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when available.
+
+    Output is compact unless indent is set (2 spaces). Decode errors from
+    either backend are json.JSONDecodeError subclasses.
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 # Directory where all recordings are saved
 RECORDINGS_DIR = Path("./recordings")
@@ -41,8 +82,17 @@ CONFIG_FILE = Path.home() / ".mimic_config.json"
 MOLTBOT_CONFIG_FILE = Path.home() / ".moltbot" / "config.json"
 CLAWDBOT_CONFIG_FILE = Path.home() / ".clawdbot" / "config.json"
 
+# Screenshots are recorded as uncompressed BMPs (the captured pixels plus a
+# fixed header) to keep the capture loop cheap. This file in the task folder
+# records their size and the recording's wall-clock start time.
+FRAME_INFO_FILE = "frames.json"
+# Recorded actions, one compact JSON object per line, appended as they happen
+ACTIONS_FILE = "actions.ndjson"
+
 # Common patterns that might indicate sensitive areas (coordinates to blur)
 SENSITIVE_KEYWORDS = ["password", "secret", "token", "key", "credit", "ssn", "bank"]
+# All keywords in one pattern, so a string is checked in a single pass
+SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYWORDS)))
 
 # Supported models and their configurations
 SUPPORTED_MODELS = {
@@ -64,32 +114,87 @@ SUPPORTED_MODELS = {
 }
 
 DEFAULT_MODEL = "sonnet"
+# Valid values for 'mimic compile --model'
+MODEL_CHOICES = tuple(SUPPORTED_MODELS)
+# The model list shown by 'mimic test', with the default marked
+MODEL_TABLE = "\n".join(
+    f"   {'→' if name == DEFAULT_MODEL else ' '} {name}: {cfg['description']}"
+    for name, cfg in SUPPORTED_MODELS.items()
+)
+
+# 'mimic install-trigger' success banner, encoded once: it's written
+# straight to the binary stdout around the install location
+INSTALL_BANNER_PREFIX = "✅ Mimic chat trigger skill installed!\n   Location: ".encode("utf-8")
+INSTALL_BANNER_SUFFIX = """
+
+📱 You can now use these commands in Moltbot chat:
+   /mimic_start <task_name>  - Start recording
+   /mimic_stop               - Stop recording
+   /mimic_compile <name>     - Generate skill
+   /mimic_status             - Check recording status
+
+💡 Tip: Run 'molt skills reload' to load the new skill immediately
+""".encode("utf-8")
+
+
+def get_mtime_ns(path):
+    """Return the file's modification time in ns, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def read_json_file(path, mtime_ns):
+    """
+    Parse a JSON file.
+
+    Cached by (path, mtime) so config files read by several lookups in one
+    command are only parsed once, while edits are still picked up.
+    """
+    return json_loads(path.read_bytes())
 
 
 def load_moltbot_config():
     """Load Moltbot/Clawdbot config file to get API key and settings."""
     # Try clawdbot first (legacy), then moltbot
-    config_file = None
-    if CLAWDBOT_CONFIG_FILE.exists():
-        config_file = CLAWDBOT_CONFIG_FILE
-    elif MOLTBOT_CONFIG_FILE.exists():
-        config_file = MOLTBOT_CONFIG_FILE
-
-    if not config_file:
+    for config_file in (CLAWDBOT_CONFIG_FILE, MOLTBOT_CONFIG_FILE):
+        mtime_ns = get_mtime_ns(config_file)
+        if mtime_ns is not None:
+            break
+    else:
         return None
 
     try:
-        config = json.loads(config_file.read_text())
-        return config
+        # Copied, so callers can't modify the cached dict
+        return dict(read_json_file(config_file, mtime_ns))
     except (json.JSONDecodeError, IOError):
         return None
 
 
-def get_api_key():
+def get_moltbot_api_key(moltbot_config):
+    """Extract the Anthropic API key from a loaded Moltbot config, if any."""
+    if not moltbot_config:
+        return None
+
+    # Moltbot might store it as 'anthropic_api_key' or 'api_key' or nested
+    api_key = moltbot_config.get("anthropic_api_key")
+    if not api_key:
+        api_key = moltbot_config.get("api_key")
+    if not api_key:
+        # Check nested structure
+        providers = moltbot_config.get("providers", {})
+        anthropic_config = providers.get("anthropic", {})
+        api_key = anthropic_config.get("api_key")
+    return api_key
+
+
+def get_api_key(moltbot_config=None):
     """
     Get Anthropic API key with fallback chain:
     1. ANTHROPIC_API_KEY env var
-    2. Moltbot's config.json
+    2. Moltbot's config.json (pass moltbot_config if already loaded)
     3. Mimic's config.json
     """
     # 1. Check environment variable first
@@ -98,19 +203,11 @@ def get_api_key():
         return api_key
 
     # 2. Try Moltbot's config
-    moltbot_config = load_moltbot_config()
-    if moltbot_config:
-        # Moltbot might store it as 'anthropic_api_key' or 'api_key' or nested
-        api_key = moltbot_config.get("anthropic_api_key")
-        if not api_key:
-            api_key = moltbot_config.get("api_key")
-        if not api_key:
-            # Check nested structure
-            providers = moltbot_config.get("providers", {})
-            anthropic_config = providers.get("anthropic", {})
-            api_key = anthropic_config.get("api_key")
-        if api_key:
-            return api_key
+    if moltbot_config is None:
+        moltbot_config = load_moltbot_config()
+    api_key = get_moltbot_api_key(moltbot_config)
+    if api_key:
+        return api_key
 
     # 3. Try Mimic's own config
     mimic_config = load_config()
@@ -156,51 +253,145 @@ def get_model_config(model_name=None):
     return SUPPORTED_MODELS[model_name]
 
 
+def downscaled_blur(img, blur_strength, scale):
+    """
+    Blur an image cheaply by working at reduced resolution.
+
+    The image is shrunk by `scale`, blurred with three box blur passes
+    (approximating a Gaussian with sigma=blur_strength at full size) and
+    enlarged back. A strong blur leaves no detail finer than the shrunk
+    pixels anyway, so this looks the same while touching scale² fewer pixels.
+    """
+    from PIL import Image, ImageFilter
+
+    width, height = img.size
+    small = img.resize((max(1, width // scale), max(1, height // scale)), Image.BILINEAR)
+
+    # Box radius whose 3-pass result matches the scaled-down sigma
+    sigma = blur_strength / scale
+    radius = max(1, round((math.sqrt(12 * sigma ** 2 / 3 + 1) - 1) / 2))
+
+    for _ in range(3):
+        small = small.filter(ImageFilter.BoxBlur(radius))
+
+    return small.resize((width, height), Image.BILINEAR)
+
+
 def apply_privacy_blur(img, blur_strength=35):
     """
     Apply heavy privacy blur to make ALL text unreadable.
 
     Strategy:
-    1. Apply strong blur to completely obscure text
+    1. Blur at 1/8 resolution - text strokes don't survive the downscale,
+       and it's far cheaper than blurring a full-screen image
     2. Keep only basic shapes/colors for Claude to understand UI layout
     """
-    # Apply heavy gaussian blur - text will be completely unreadable
-    blurred = img.filter(ImageFilter.GaussianBlur(radius=blur_strength))
-
-    # Apply a second pass for extra strength
-    blurred = blurred.filter(ImageFilter.GaussianBlur(radius=20))
-
-    # Blend: 90% blurred, 10% original (just enough to see color boundaries)
-    blended = Image.blend(img, blurred, alpha=0.9)
-
-    return blended
+    return downscaled_blur(img, blur_strength, scale=8)
 
 
 def apply_region_blur(img, regions):
     """
-    Blur specific regions of an image.
+    Blur specific regions of an image, in place.
 
     Args:
-        img: PIL Image
+        img: PIL Image (modified in place; copy it first if the original
+            is still needed)
         regions: List of (x, y, width, height) tuples to blur
 
     Returns:
-        Image with specified regions blurred
+        The same image, with specified regions blurred
     """
-    result = img.copy()
-
+    img_width, img_height = img.size
     for x, y, w, h in regions:
-        # Extract region
-        box = (x, y, x + w, y + h)
-        region = result.crop(box)
+        # Extract region, clipped to the image - crop() would pad the part
+        # outside it with black, which the blur then smears inwards
+        box = (max(0, x), max(0, y), min(img_width, x + w), min(img_height, y + h))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            continue
+        region = img.crop(box)
 
-        # Blur it heavily
-        blurred_region = region.filter(ImageFilter.GaussianBlur(radius=20))
+        # Blur it heavily (regions are small, so downscale less)
+        blurred_region = downscaled_blur(region, blur_strength=20, scale=4)
 
         # Paste back
-        result.paste(blurred_region, box)
+        img.paste(blurred_region, box)
+
+    return img
+
+
+def bmp_header(width, height):
+    """
+    Build the 54-byte header that makes a top-down 32-bit BGRX pixel buffer
+    (what mss captures) a valid BMP file, viewable in any image viewer.
+    """
+    image_size = width * height * 4
+    file_header = struct.pack("<2sIHHI", b"BM", 54 + image_size, 0, 0, 54)
+    # Negative height = rows stored top to bottom; 32 bpp, uncompressed
+    info_header = struct.pack("<IiiHHIIiiII", 40, width, -height, 1, 32, 0, image_size, 2835, 2835, 0, 0)
+    return file_header + info_header
+
+
+def save_frame(data, size, filename, privacy_mode, regions=()):
+    """
+    Write one captured frame to disk as a BMP of its BGRX pixels.
+
+    In privacy mode the whole frame is blurred in memory first; otherwise
+    just the given (x, y, width, height) regions are. Either way unblurred
+    pixels never reach disk. Runs on the recorder's worker threads.
+    """
+    if privacy_mode or regions:
+        # Wrap the BGRX pixels without copying them. Pillow can only map
+        # buffers zero-copy in a few layouts, so treat them as RGBX (red and
+        # blue swapped) - blurring handles every channel the same way, so
+        # writing the result back in that layout gives correct BGRX again.
+        from PIL import Image
+        img = Image.frombuffer("RGBX", size, data, "raw", "RGBX", 0, 1)
+        if privacy_mode:
+            img = apply_privacy_blur(img)
+        else:
+            img = apply_region_blur(img, regions)
+        data = img.tobytes("raw", "RGBX")
+
+    # The pixels are already in BMP layout, so they're written as they are
+    with filename.open("wb") as f:
+        f.write(bmp_header(*size))
+        f.write(data)
+
+
+# Safety limit for walking down the accessibility tree
+MAX_ELEMENT_DEPTH = 64
+
+
+def find_deepest_at_point(obj, x, y):
+    """Walk down from obj to the deepest descendant containing (x, y)."""
+    for _ in range(MAX_ELEMENT_DEPTH):
+        try:
+            component = obj.get_component_iface()
+            child = component.get_accessible_at_point(x, y, Atspi.CoordType.SCREEN) if component else None
+        except Exception:
+            child = None
+
+        if not child or child == obj:
+            break
+        obj = child
+
+    return obj
 
-    return result
+
+def load_atspi():
+    """Import the AT-SPI accessibility library on first call. Returns True if available."""
+    global Atspi, ATSPI_AVAILABLE
+
+    if ATSPI_AVAILABLE is None:
+        try:
+            import gi
+            gi.require_version('Atspi', '2.0')
+            from gi.repository import Atspi
+            ATSPI_AVAILABLE = True
+        except (ImportError, ValueError):
+            ATSPI_AVAILABLE = False  # Not available on this system
+
+    return ATSPI_AVAILABLE
 
 
 def get_element_at_point(x, y):
@@ -208,91 +399,127 @@ def get_element_at_point(x, y):
     Get accessibility information about the UI element at the given coordinates.
     Returns dict with role, name, description, or None if not available.
     """
-    if not ATSPI_AVAILABLE:
+    if not load_atspi():
         return None
 
-    try:
-        # Get the desktop (root of accessibility tree)
-        desktop = Atspi.get_desktop(0)
-        if not desktop:
-            return None
+    # Serialized with the capture loop's collect_sensitive_regions()
+    with ATSPI_LOCK:
+        try:
+            # Get the desktop (root of accessibility tree)
+            desktop = Atspi.get_desktop(0)
+            if not desktop:
+                return None
 
-        # Find the element at the given point
-        element = Atspi.get_desktop(0)
+            # Try to find element at point using desktop's children (applications)
+            element = None
+            for i in range(desktop.get_child_count()):
+                try:
+                    app = desktop.get_child_at_index(i)
+                    if not app:
+                        continue
 
-        # Traverse to find the deepest element at point
-        def find_at_point(obj, x, y):
-            if obj is None:
+                    component = app.get_component_iface()
+                    if not component:
+                        continue
+
+                    child = component.get_accessible_at_point(x, y, Atspi.CoordType.SCREEN)
+                    if child:
+                        element = find_deepest_at_point(child, x, y)
+                        break
+                except Exception:
+                    continue
+
+            if element is None:
                 return None
 
+            # Extract useful information
+            role = element.get_role_name()
+            name = element.get_name()
+            description = ""
+
             try:
-                # Try to get component interface
-                component = obj.get_component_iface()
-                if component:
-                    # Check if point is within this element
-                    child = component.get_accessible_at_point(x, y, Atspi.CoordType.SCREEN)
-                    if child and child != obj:
-                        # Recurse into child
-                        result = find_at_point(child, x, y)
-                        if result:
-                            return result
-                        return child
-            except:
+                description = element.get_description()
+            except Exception:
                 pass
 
-            return obj
-
-        # Try to find element at point using desktop's children (applications)
-        for i in range(desktop.get_child_count()):
+            # Get parent info for context
+            parent_name = ""
             try:
-                app = desktop.get_child_at_index(i)
-                if app:
-                    component = app.get_component_iface()
-                    if component:
-                        child = component.get_accessible_at_point(x, y, Atspi.CoordType.SCREEN)
-                        if child:
-                            # Found an element, get its info
-                            element = find_at_point(child, x, y) or child
-
-                            # Extract useful information
-                            role = element.get_role_name() if element else "unknown"
-                            name = element.get_name() if element else ""
-                            description = ""
-
-                            try:
-                                description = element.get_description() if element else ""
-                            except:
-                                pass
-
-                            # Get parent info for context
-                            parent_name = ""
-                            try:
-                                parent = element.get_parent()
-                                if parent:
-                                    parent_name = parent.get_name() or ""
-                            except:
-                                pass
-
-                            return {
-                                "role": role,
-                                "name": name,
-                                "description": description,
-                                "parent": parent_name
-                            }
-            except:
-                continue
+                parent = element.get_parent()
+                if parent:
+                    parent_name = parent.get_name() or ""
+            except Exception:
+                pass
 
-        return None
+            return {
+                "role": role,
+                "name": name,
+                "description": description,
+                "parent": parent_name
+            }
 
-    except Exception as e:
-        # Silently fail - accessibility is optional
-        return None
+        except Exception as e:
+            # Silently fail - accessibility is optional
+            return None
 
 
+def collect_sensitive_regions():
+    """
+    Find the password fields currently showing on screen.
+
+    Uses each application's AT-SPI Collection interface, which searches
+    its whole tree in one call instead of walking it from Python.
+    Returns a list of (x, y, width, height) tuples in screen coordinates;
+    empty if accessibility isn't available.
+    """
+    if not load_atspi():
+        return []
+
+    # Serialized with the click handler's get_element_at_point()
+    regions = []
+    with ATSPI_LOCK:
+        try:
+            rule = Atspi.MatchRule.new(
+                Atspi.StateSet.new([Atspi.StateType.SHOWING]), Atspi.CollectionMatchType.ALL,
+                {}, Atspi.CollectionMatchType.ALL,
+                [Atspi.Role.PASSWORD_TEXT], Atspi.CollectionMatchType.ANY,
+                [], Atspi.CollectionMatchType.ALL,
+                False
+            )
+
+            desktop = Atspi.get_desktop(0)
+            for i in range(desktop.get_child_count()):
+                try:
+                    app = desktop.get_child_at_index(i)
+                    collection = app.get_collection_iface() if app else None
+                    if not collection:
+                        continue
+
+                    matches = collection.get_matches(rule, Atspi.CollectionSortOrder.CANONICAL, 0, True)
+                    for element in matches:
+                        component = element.get_component_iface()
+                        if not component:
+                            continue
+                        rect = component.get_extents(Atspi.CoordType.SCREEN)
+                        if rect.width > 0 and rect.height > 0:
+                            regions.append((rect.x, rect.y, rect.width, rect.height))
+                except Exception:
+                    continue
+
+        except Exception:
+            # Silently fail - accessibility is optional
+            pass
+
+    return regions
+
+
+@functools.cache
 def get_default_moltbot_path():
-    """Get the default Clawdbot/Moltbot skills path based on OS."""
-    system = platform.system()
+    """
+    Get the default Clawdbot/Moltbot skills path based on OS.
 
+    Cached for the life of the process; the install location doesn't move.
+    """
     # Default to .clawdbot, fallback to .moltbot if it exists
     clawdbot_path = Path.home() / ".clawdbot" / "skills"
     moltbot_path = Path.home() / ".moltbot" / "skills"
@@ -303,13 +530,13 @@ def get_default_moltbot_path():
     if moltbot_path.exists():
         return moltbot_path
 
-    if system == "Windows":
+    if sys.platform == "win32":
         appdata = os.environ.get("APPDATA")
         if appdata:
             return Path(appdata) / "clawdbot" / "skills"
         return clawdbot_path
 
-    elif system == "Darwin":
+    elif sys.platform == "darwin":
         clawdbot_lib = Path.home() / "Library" / "Application Support" / "clawdbot" / "skills"
         if clawdbot_lib.parent.exists():
             return clawdbot_lib
@@ -322,20 +549,28 @@ def get_default_moltbot_path():
 
 def load_config():
     """Load Mimic config from file."""
-    if CONFIG_FILE.exists():
-        return json.loads(CONFIG_FILE.read_text())
+    mtime_ns = get_mtime_ns(CONFIG_FILE)
+    if mtime_ns is not None:
+        # Copied, so changes made before save_config() (which may fail)
+        # don't leak into the cached dict
+        return dict(read_json_file(CONFIG_FILE, mtime_ns))
     return {}
 
 
 def save_config(config):
     """Save Mimic config to file."""
-    CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    CONFIG_FILE.write_bytes(json_dumps(config, indent=True))
+    # The mtime may not change on coarse-grained filesystems
+    read_json_file.cache_clear()
 
 
+@functools.cache
 def get_moltbot_skills_dir():
     """
     Get the Moltbot skills directory.
     Checks: env var > config file > default path > prompt user
+
+    Cached for the life of the process, so the user is prompted at most once.
     """
     # 1. Check environment variable
     env_path = os.environ.get("MOLTBOT_SKILLS_DIR")
@@ -421,14 +656,14 @@ def save_state(task_name, start_time):
         "start_time": start_time,
         "recording": True
     }
-    STATE_FILE.write_text(json.dumps(state))
+    STATE_FILE.write_bytes(json_dumps(state))
 
 
 def load_state():
     """Load recording state from file. Returns None if not recording."""
     if not STATE_FILE.exists():
         return None
-    return json.loads(STATE_FILE.read_text())
+    return json_loads(STATE_FILE.read_bytes())
 
 
 def clear_state():
@@ -458,7 +693,7 @@ def cmd_start(args):
         print("=" * 50)
         print()
         print("Mimic will capture:")
-        print("  • Screenshots of your ENTIRE screen (every 2 sec)")
+        print("  • Screenshots of your ENTIRE screen (every 2 sec while you're active)")
         print("  • All mouse clicks (coordinates)")
         print("  • All keyboard input (keys pressed)")
         print()
@@ -498,9 +733,14 @@ def cmd_start(args):
     if STOP_FILE.exists():
         STOP_FILE.unlink()
 
-    # Save recording state
-    start_time = time.time()
-    save_state(task_name, start_time)
+    # Save recording state (wall-clock start, so 'mimic status' in another
+    # process can compute elapsed time)
+    start_wallclock = time.time()
+    save_state(task_name, start_wallclock)
+
+    # Action timestamps are offsets on the monotonic clock, which is cheaper
+    # to read and unaffected by wall-clock adjustments mid-recording
+    start_time = time.monotonic()
 
     privacy_mode = getattr(args, 'privacy', False)
     print(f"🎬 Recording started: '{task_name}'")
@@ -511,8 +751,72 @@ def cmd_start(args):
     print(f"   (or wait 60 seconds for auto-stop)")
     print()
 
-    # List to store all recorded actions
-    actions = []
+    # Recorded actions are streamed to disk as they happen rather than kept
+    # in memory. Unbuffered, so every complete line is on disk even if the
+    # recorder is killed.
+    actions_fp = (task_dir / ACTIONS_FILE).open("wb", buffering=0)
+    action_count = 0
+
+    # The input listener callbacks only queue (action, warnings to print)
+    # here; the capture loop writes them to `actions_fp` and updates the
+    # status line, so no I/O happens on the input hook threads and only one
+    # thread writes. deque.append/popleft are atomic, so no lock is needed.
+    events = collections.deque()
+
+    # Action counts by type, shown on the status line. Only the capture
+    # loop's thread touches these.
+    action_types = collections.Counter()
+    status_width = 0
+
+    # Set by the input listeners; the capture loop skips frames while it's
+    # clear, since an idle screen mostly repeats the previous frame
+    activity = threading.Event()
+
+    # The status line is only redrawn in place on a terminal. When output
+    # is captured (e.g. Moltbot running 'mimic start -y'), it's printed as
+    # a normal line once per new screenshot instead.
+    interactive = sys.stdout.isatty()
+    reported_count = None
+
+    def print_above_status(line):
+        """Print a line, overwriting the status line (redrawn later)."""
+        nonlocal status_width
+        if not interactive:
+            print(line)
+            return
+        sys.stdout.write("\r" + line.ljust(status_width) + "\n")
+        status_width = 0
+
+    def drain_events():
+        """Write queued actions to the actions file and print any warnings."""
+        nonlocal action_count
+        while events:
+            action, lines = events.popleft()
+            actions_fp.write(json_dumps(action) + b"\n")
+            action_count += 1
+            action_types[action["type"]] += 1
+            for line in lines:
+                print_above_status(line)
+
+    def render_status(elapsed, note=""):
+        """Redraw the single progress line in place."""
+        nonlocal status_width, reported_count
+        status = (
+            f"   ⏺️  {int(elapsed)}s | 📸 {screenshot_count} screenshots"
+            f" | 🖱️  {action_types['click']} clicks"
+            f" | ⌨️  {action_types['typed_text']} typed, {action_types['special_key']} keys"
+            f"{note}"
+        )
+        if not interactive:
+            if screenshot_count != reported_count:
+                print(status)
+                reported_count = screenshot_count
+            return
+        # Pad with spaces to cover a longer previous status (no ANSI
+        # escapes, which older Windows consoles don't understand)
+        sys.stdout.write("\r" + status.ljust(status_width))
+        sys.stdout.flush()
+        status_width = len(status)
 
     # Track if we've warned about sensitive areas
     sensitive_warning_shown = [False]  # Use list to allow mutation in nested func
@@ -520,17 +824,19 @@ def cmd_start(args):
     # Mouse click handler
     def on_click(x, y, button, pressed):
         if pressed:  # Only log when button is pressed, not released
+            activity.set()
             action = {
                 "type": "click",
                 "x": x,
                 "y": y,
                 "button": str(button),
-                "timestamp": time.time() - start_time
+                "timestamp": time.monotonic() - start_time
             }
 
             # Try to get accessibility info for the clicked element
             element_info = get_element_at_point(x, y)
             is_sensitive = False
+            lines = []
 
             if element_info:
                 action["element"] = element_info
@@ -539,29 +845,21 @@ def cmd_start(args):
                 elem_desc = element_info.get("name") or element_info.get("role", "unknown")
 
                 # Check if element appears to be sensitive
-                for keyword in SENSITIVE_KEYWORDS:
-                    if keyword in elem_name or keyword in elem_role:
-                        is_sensitive = True
-                        action["sensitive"] = True
-                        break
+                if SENSITIVE_RE.search(elem_name) or SENSITIVE_RE.search(elem_role):
+                    is_sensitive = True
+                    action["sensitive"] = True
 
                 # Also check for password input fields
                 if elem_role in ("password text", "password", "secret"):
                     is_sensitive = True
                     action["sensitive"] = True
 
-                if is_sensitive:
-                    print(f"   🖱️  Click at ({x}, {y}) - ⚠️  [{element_info['role']}] {elem_desc} [SENSITIVE]")
-                    if not sensitive_warning_shown[0]:
-                        print(f"   ⚠️  WARNING: Clicked on potentially sensitive field!")
-                        print(f"   ⚠️  Consider stopping and using --privacy mode")
-                        sensitive_warning_shown[0] = True
-                else:
-                    print(f"   🖱️  Click at ({x}, {y}) - [{element_info['role']}] {elem_desc}")
-            else:
-                print(f"   🖱️  Click at ({x}, {y})")
+                if is_sensitive and not sensitive_warning_shown[0]:
+                    lines.append(f"   ⚠️  WARNING: Clicked on potentially sensitive field: [{element_info['role']}] {elem_desc}")
+                    lines.append(f"   ⚠️  Consider stopping and using --privacy mode")
+                    sensitive_warning_shown[0] = True
 
-            actions.append(action)
+            events.append((action, lines))
 
     # Keystroke buffer for grouping
     keystroke_buffer = []
@@ -573,23 +871,13 @@ def cmd_start(args):
             return
 
         typed_text = "".join(keystroke_buffer)
-        timestamp = buffer_start_time[0] or (time.time() - start_time)
+        timestamp = buffer_start_time[0] or (time.monotonic() - start_time)
 
         # Check if text contains sensitive patterns
-        is_sensitive = False
-        text_lower = typed_text.lower()
-        for keyword in SENSITIVE_KEYWORDS:
-            if keyword in text_lower:
-                is_sensitive = True
-                break
+        is_sensitive = bool(SENSITIVE_RE.search(typed_text.lower()))
 
         # Redact if sensitive
-        if is_sensitive:
-            display_text = "[REDACTED]"
-            stored_text = "[REDACTED]"
-        else:
-            display_text = typed_text if len(typed_text) <= 20 else typed_text[:17] + "..."
-            stored_text = typed_text
+        stored_text = "[REDACTED]" if is_sensitive else typed_text
 
         action = {
             "type": "typed_text",
@@ -600,8 +888,7 @@ def cmd_start(args):
         if is_sensitive:
             action["sensitive"] = True
 
-        actions.append(action)
-        print(f"   ⌨️  Typed: \"{display_text}\"" + (" [SENSITIVE]" if is_sensitive else ""))
+        events.append((action, []))
 
         # Clear buffer
         keystroke_buffer.clear()
@@ -609,12 +896,13 @@ def cmd_start(args):
 
     # Keyboard handler
     def on_key_press(key):
+        activity.set()
         try:
             key_char = key.char  # Regular character key
             if key_char:
                 # Start buffer timing on first char
                 if buffer_start_time[0] is None:
-                    buffer_start_time[0] = time.time() - start_time
+                    buffer_start_time[0] = time.monotonic() - start_time
                 keystroke_buffer.append(key_char)
         except AttributeError:
             # Special key - flush buffer first, then log the special key
@@ -624,15 +912,17 @@ def cmd_start(args):
             action = {
                 "type": "special_key",
                 "key": key_name,
-                "timestamp": time.time() - start_time
+                "timestamp": time.monotonic() - start_time
             }
-            actions.append(action)
 
-            # Only print certain special keys to reduce noise
-            if key_name in ("Key.enter", "Key.tab", "Key.escape", "Key.backspace"):
-                print(f"   ⌨️  {key_name.replace('Key.', '').upper()}")
+            events.append((action, []))
+
+    # Load accessibility support now rather than on the first click
+    load_atspi()
 
-    # Start input listeners in background threads
+    # Start input listeners in background threads (imported here so
+    # commands that don't record don't pay for it)
+    from pynput import mouse, keyboard
     mouse_listener = mouse.Listener(on_click=on_click)
     keyboard_listener = keyboard.Listener(on_press=on_key_press)
     mouse_listener.start()
@@ -641,49 +931,143 @@ def cmd_start(args):
     # Screenshot capture loop
     screenshot_count = 0
     interval = 2  # seconds between screenshots
+    keepalive = 10  # max seconds between screenshots while idle
     max_duration = 60  # auto-stop after 60 seconds
 
+    # Blurring and writing frames happens on worker threads so it doesn't
+    # delay the next capture. At most 4 frames (~120 MB at 4K) may be
+    # waiting at once; beyond that the capture loop blocks until one is done.
+    save_executor = ThreadPoolExecutor(max_workers=2)
+    pending_frames = threading.BoundedSemaphore(4)
+
+    # Password fields are looked up on their own thread, waiting at most
+    # `regions_budget` seconds per frame: an unresponsive app can block
+    # AT-SPI calls for the whole D-Bus timeout. If the lookup isn't done by
+    # then, the previous frame's regions are used and the lookup is left to
+    # finish for a later frame.
+    region_executor = ThreadPoolExecutor(max_workers=1)
+    region_lookup = None
+    regions_budget = 0.5
+    regions = []
+
+    # Save errors are reported by the capture loop, which owns the terminal
+    save_errors = collections.deque()
+
+    def on_frame_saved(future):
+        pending_frames.release()
+        error = future.exception()
+        if error:
+            save_errors.append(error)
+
+    next_capture = time.monotonic()
+    last_capture = next_capture
+    status_interval = 0.5  # seconds between status line redraws
+    frame_note = ""
+
+    # Imported here so commands that don't record don't pay for it
+    import mss
+
     try:
         with mss.mss() as sct:
+            # The monitor geometry doesn't change during a recording
+            monitor = sct.monitors[0]
+
             while True:
+                # Record input events that arrived since the last pass
+                drain_events()
+                while save_errors:
+                    print_above_status(f"   ⚠️  Failed to save screenshot: {save_errors.popleft()}")
+
                 # Check for stop signal
                 if STOP_FILE.exists():
                     print("\n⏹️  Stop signal received")
                     break
 
                 # Check for timeout
-                elapsed = time.time() - start_time
+                now = time.monotonic()
+                elapsed = now - start_time
                 if elapsed >= max_duration:
                     print(f"\n⏱️  Auto-stopping after {max_duration} seconds")
                     break
 
-                # Capture screenshot
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = screenshots_dir / f"screen_{timestamp}_{screenshot_count:04d}.png"
+                render_status(elapsed, frame_note)
+
+                # Wait for the next capture, waking up to redraw the status
+                if now < next_capture:
+                    time.sleep(min(status_interval, next_capture - now))
+                    continue
+
+                # Skip the frame if nothing happened since the last one,
+                # unless it's time for a keepalive frame. While idle, poll
+                # so a frame follows soon after input resumes.
+                idle = not activity.is_set() and now - last_capture < keepalive
+                if screenshot_count and idle:
+                    activity.wait(0.25)
+                    continue
+                activity.clear()
+
+                # Capture screenshot (the recording start time is in
+                # FRAME_INFO_FILE, so the counter alone names the frame)
+                filename = screenshots_dir / f"screen_{screenshot_count:04d}.bmp"
+
+                # Privacy mode blurs everything; otherwise still blur any
+                # password fields on screen (converted to image coordinates)
+                if not privacy_mode:
+                    if region_lookup is None:
+                        region_lookup = region_executor.submit(collect_sensitive_regions)
+                    try:
+                        found = region_lookup.result(timeout=regions_budget)
+                        region_lookup = None
+                        regions = [
+                            (x - monitor["left"], y - monitor["top"], w, h)
+                            for x, y, w, h in found
+                        ]
+                    except FutureTimeoutError:
+                        pass  # Slow app - keep the previous frame's regions
+
+                screenshot = sct.grab(monitor)
+                last_capture = time.monotonic()
+
+                # Record the frame size once
+                if screenshot_count == 0:
+                    frame_info = {
+                        "width": screenshot.width,
+                        "height": screenshot.height,
+                        "start_time": start_wallclock
+                    }
+                    (task_dir / FRAME_INFO_FILE).write_bytes(json_dumps(frame_info))
+
+                # Save the pixels in the background - encoding is deferred
+                # to compile time. .raw is mss's own (fresh per grab) buffer;
+                # .bgra would copy it first.
+                pending_frames.acquire()
+                future = save_executor.submit(
+                    save_frame, screenshot.raw, screenshot.size, filename, privacy_mode, regions
+                )
+                future.add_done_callback(on_frame_saved)
 
-                # Check if privacy mode is enabled
-                privacy_mode = getattr(args, 'privacy', False)
+                screenshot_count += 1
 
                 if privacy_mode:
-                    # Capture to memory, apply blur, then save
-                    screenshot = sct.grab(sct.monitors[0])
-                    img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                    img = apply_privacy_blur(img)
-                    img.save(str(filename))
+                    frame_note = " [BLURRED]"
+                elif regions:
+                    frame_note = f" [{len(regions)} password field(s) blurred]"
                 else:
-                    sct.shot(output=str(filename))
-
-                screenshot_count += 1
-
-                privacy_indicator = " [BLURRED]" if privacy_mode else ""
-                print(f"   📸 Screenshot {screenshot_count} saved ({int(elapsed)}s elapsed){privacy_indicator}")
+                    frame_note = ""
 
-                # Wait for next capture
-                time.sleep(interval)
+                # Schedule the next capture, keeping a steady cadence
+                # (without bursting to catch up if saving fell behind)
+                next_capture = max(next_capture + interval, time.monotonic())
 
     except KeyboardInterrupt:
         print("\n⏹️  Stopped by Ctrl+C")
 
+    # Finish writing any frames still in flight
+    save_executor.shutdown(wait=True)
+    region_executor.shutdown(wait=False, cancel_futures=True)
+    while save_errors:
+        print(f"   ⚠️  Failed to save screenshot: {save_errors.popleft()}")
+
     # Flush any remaining keystrokes in buffer
     flush_keystroke_buffer()
 
@@ -691,15 +1075,15 @@ def cmd_start(args):
     mouse_listener.stop()
     keyboard_listener.stop()
 
-    # Save actions to JSON file
-    actions_file = task_dir / "actions.json"
-    actions_file.write_text(json.dumps(actions, indent=2))
+    # Collect whatever the listeners queued after the last frame
+    drain_events()
+    actions_fp.close()
 
     # Recording finished
     clear_state()
     print(f"\n✅ Recording complete!")
     print(f"   Screenshots saved: {screenshot_count}")
-    print(f"   Actions logged: {len(actions)}")
+    print(f"   Actions logged: {action_count}")
     print(f"   Location: {task_dir}/")
 
     # Auto-compile if flag is set
@@ -762,6 +1146,39 @@ def estimate_cost(num_screenshots, num_actions):
     }
 
 
+def encode_screenshot(img_path):
+    """
+    Prepare one screenshot for the Claude API.
+
+    Scales it down to at most 1280px wide, JPEG-compresses it and returns
+    the base64 string. Top-level so it can run in a worker process.
+    """
+    from PIL import Image
+
+    # Open and resize image to max 1280px width
+    img = Image.open(img_path)
+    max_width = 1280
+    if img.width > max_width:
+        ratio = max_width / img.width
+        new_size = (max_width, int(img.height * ratio))
+
+        # Let the decoder scale down while decoding where it can (JPEG only)
+        img.draft("RGB", new_size)
+
+        # For big downscales, first shrink by a cheap integer factor and only
+        # resample the remaining (at least 2x) - same default as thumbnail().
+        # BILINEAR rather than LANCZOS: the q70 JPEG below discards the extra
+        # sharpness anyway.
+        img = img.resize(new_size, Image.BILINEAR, reducing_gap=2.0)
+
+    # Convert to JPEG (much smaller than PNG)
+    if img.mode == 'RGBA':
+        img = img.convert('RGB')
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=70)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
 def compile_recording(task_name, cost_only=False, model_name=None):
     """Send recording to Claude and generate SKILL.md."""
 
@@ -780,16 +1197,20 @@ def compile_recording(task_name, cost_only=False, model_name=None):
         sys.exit(1)
 
     screenshots_dir = task_dir / "screenshots"
-    actions_file = task_dir / "actions.json"
+    actions_file = task_dir / ACTIONS_FILE
+    legacy_actions_file = task_dir / "actions.json"
 
-    # Load actions
+    # Load actions (older recordings saved a single JSON array)
     if actions_file.exists():
-        actions = json.loads(actions_file.read_text())
+        with actions_file.open("rb") as f:
+            actions = [json_loads(line) for line in f if line.strip()]
+    elif legacy_actions_file.exists():
+        actions = json_loads(legacy_actions_file.read_bytes())
     else:
         actions = []
 
-    # Load screenshots as base64
-    screenshot_files = sorted(screenshots_dir.glob("*.png"))
+    # Find screenshots (BMPs, or PNGs from older recordings)
+    screenshot_files = sorted(screenshots_dir.glob("*.bmp")) or sorted(screenshots_dir.glob("*.png"))
 
     if not screenshot_files:
         print(f"❌ No screenshots found in {screenshots_dir}")
@@ -823,23 +1244,14 @@ def compile_recording(task_name, cost_only=False, model_name=None):
     # Build message content with images and actions
     content = []
 
-    # Add each screenshot (resized + JPEG compressed)
-    for i, img_path in enumerate(screenshot_files):
-        # Open and resize image to max 1280px width
-        img = Image.open(img_path)
-        max_width = 1280
-        if img.width > max_width:
-            ratio = max_width / img.width
-            new_size = (max_width, int(img.height * ratio))
-            img = img.resize(new_size, Image.LANCZOS)
-
-        # Convert to JPEG (much smaller than PNG)
-        if img.mode == 'RGBA':
-            img = img.convert('RGB')
-        buffer = io.BytesIO()
-        img.save(buffer, format="JPEG", quality=70)
-        img_data = base64.standard_b64encode(buffer.getvalue()).decode("utf-8")
+    # Resize + JPEG compress all screenshots in parallel (CPU-bound).
+    # Imported here: it pulls in multiprocessing, which nothing else needs.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor() as executor:
+        encoded = list(executor.map(encode_screenshot, screenshot_files))
 
+    # Add each screenshot
+    for i, img_data in enumerate(encoded):
         content.append({
             "type": "text",
             "text": f"Screenshot {i+1} of {len(screenshot_files)}:"
@@ -856,7 +1268,12 @@ def compile_recording(task_name, cost_only=False, model_name=None):
     # Check if any actions have element info
     has_element_info = any(a.get("element") for a in actions if a.get("type") == "click")
 
-    # Add actions JSON
+    # Add actions JSON, compact with one action per line (indenting every
+    # field roughly doubles the tokens spent on it)
+    actions_json = "[\n" + ",\n".join(
+        json_dumps(action).decode("utf-8") for action in actions
+    ) + "\n]"
+
     element_note = ""
     if has_element_info:
         element_note = """
@@ -876,7 +1293,7 @@ the skill works even if the UI layout changes slightly.
 Here are the user's mouse clicks and keyboard inputs with timestamps:
 
 ```json
-{json.dumps(actions, indent=2)}
+{actions_json}
 ```
 {element_note}
 Based on the screenshots and actions above, analyze what task the user performed.
@@ -909,6 +1326,8 @@ Return ONLY the SKILL.md content, nothing else.
 
     # Call Claude API
     print(f"📡 Sending to Claude API ({model_config['description'].split(' - ')[0]})...")
+    # Imported here so commands that don't compile don't pay for it
+    import anthropic
     client = anthropic.Anthropic()
 
     response = client.messages.create(
@@ -921,9 +1340,13 @@ Return ONLY the SKILL.md content, nothing else.
 
     skill_content = response.content[0].text
 
+    # Encoded once for both copies - as UTF-8 regardless of the locale, and
+    # without newline translation
+    skill_bytes = skill_content.encode("utf-8")
+
     # Save SKILL.md to recordings folder
     skill_file = task_dir / "SKILL.md"
-    skill_file.write_text(skill_content)
+    skill_file.write_bytes(skill_bytes)
 
     print(f"✅ Skill generated!")
     print(f"   Saved to: {skill_file}")
@@ -937,7 +1360,7 @@ Return ONLY the SKILL.md content, nothing else.
 
         if valid:
             moltbot_skill_file = moltbot_task_dir / "SKILL.md"
-            moltbot_skill_file.write_text(skill_content)
+            moltbot_skill_file.write_bytes(skill_bytes)
             print(f"   Installed to: {moltbot_skill_file}")
             print()
             print(f"🚀 Skill ready! Run with: moltbot use {task_name}")
@@ -949,7 +1372,7 @@ Return ONLY the SKILL.md content, nothing else.
         print(f"   To install manually, copy SKILL.md to your Moltbot skills folder.")
     print()
     print("--- SKILL.md Preview ---")
-    print(skill_content[:500] + "..." if len(skill_content) > 500 else skill_content)
+    print(skill_content[:500], end="...\n" if len(skill_content) > 500 else "\n")
 
 
 def cmd_compile(args):
@@ -959,22 +1382,164 @@ def cmd_compile(args):
     compile_recording(args.name, cost_only=cost_only, model_name=model_name)
 
 
+def copy_file_contents(src, dst, size):
+    """
+    Copy `size` bytes from src to a new file dst.
+
+    Uses copy_file_range where available (Linux), so the data moves within
+    the kernel - and filesystems that support it can share the blocks
+    instead of copying them. Falls back to shutil.copyfile, which uses
+    sendfile/fcopyfile itself, if the call isn't supported here.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src, dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            remaining = size
+            while remaining > 0:
+                try:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                except OSError as e:
+                    # Old kernel, or a filesystem pair it can't handle
+                    if remaining == size and e.errno in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                        break
+                    raise
+                if copied == 0:  # Source shrank since it was listed
+                    return
+                remaining -= copied
+            else:
+                return
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    shutil.copyfile(src, dst)
+
+
+def copy_file_with_stat(src, dst, st):
+    """Copy a file's contents, then its mode and timestamps from `st`."""
+    copy_file_contents(src, dst, st.st_size)
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def copy_skill_tree(src, dst):
+    """
+    Copy the skill folder src to dst, which must not exist yet.
+
+    Faster than shutil.copytree for folders of many small files: on Windows
+    robocopy copies them with several threads. Elsewhere the tree is walked
+    with os.scandir, so file types come from the directory listing and each
+    file is stat'ed once, and the files are copied in parallel - which
+    helps most when the skills folder is on slow or network storage.
+    """
+    if sys.platform == "win32":
+        import subprocess
+        try:
+            result = subprocess.run(
+                ["robocopy", str(src), str(dst), "/E", "/MT:64", "/NFL", "/NDL", "/NJH", "/NJS", "/NP"],
+                capture_output=True
+            )
+            # robocopy exit codes below 8 mean success
+            if result.returncode < 8:
+                return
+        except OSError:
+            pass
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+        return
+
+    # Walk the whole tree first: directories (parents before children)
+    # and (source, target, stat) for every file
+    dirs = [(str(src), str(dst))]
+    files = []
+    for dir_src, dir_dst in dirs:
+        with os.scandir(dir_src) as entries:
+            for entry in entries:
+                target = os.path.join(dir_dst, entry.name)
+                if entry.is_dir():
+                    dirs.append((entry.path, target))
+                else:
+                    files.append((entry.path, target, entry.stat()))
+
+    for _, dir_dst in dirs:
+        os.makedirs(dir_dst)
+
+    workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(copy_file_with_stat, *file) for file in files]
+        for future in futures:
+            future.result()  # Re-raise the first copy error, if any
+
+    # Directory timestamps last (copying files into them changes them),
+    # children before parents
+    for dir_src, dir_dst in reversed(dirs):
+        shutil.copystat(dir_src, dir_dst)
+
+
+def list_tree(root):
+    """
+    Map every path under root (relative to it) to its (size, mtime_ns),
+    or None for directories. Stats come from os.scandir entries.
+    """
+    listing = {}
+    pending = [""]
+    for rel_dir in pending:
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_dir():
+                    listing[rel_path] = None
+                    pending.append(rel_path)
+                else:
+                    st = entry.stat()
+                    listing[rel_path] = (st.st_size, st.st_mtime_ns)
+    return listing
+
+
+def trees_identical(src, dst):
+    """
+    Check whether dst holds the same files as src, by names, sizes and
+    modification times (which copy_skill_tree preserves) - no file
+    contents are read.
+    """
+    try:
+        return list_tree(src) == list_tree(dst)
+    except OSError:
+        return False
+
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """Collect what's printed inside the block and write it out at once at the end."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 def cmd_install_trigger(args):
     """Install the Mimic chat trigger skill to Moltbot."""
-    import shutil
-
     # Find the bundled skill
     # When installed via pip, skills are in the package directory
-    package_dir = Path(__file__).parent.parent
-    skill_source = package_dir / "skills" / "mimic_trigger"
+    # (plain os.path strings - this runs once and only needs one stat each)
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    skill_source = os.path.join(package_dir, "skills", "mimic_trigger")
 
     # Fallback to current directory (for development)
-    if not skill_source.exists():
-        skill_source = Path("./skills/mimic_trigger")
+    if not os.path.isdir(skill_source):
+        skill_source = os.path.join("skills", "mimic_trigger")
 
-    if not skill_source.exists():
-        print("❌ Mimic trigger skill not found in package")
-        print("   Try reinstalling: pip install --force-reinstall mimic-moltbot")
+    if not os.path.isdir(skill_source):
+        print("❌ Mimic trigger skill not found in package\n"
+              "   Try reinstalling: pip install --force-reinstall mimic-moltbot")
         sys.exit(1)
 
     # Get Moltbot skills directory
@@ -983,230 +1548,272 @@ def cmd_install_trigger(args):
         print("❌ Could not find Moltbot skills directory")
         sys.exit(1)
 
-    # Install the skill
+    # Install the skill. The copy goes to a hidden sibling folder first (so
+    # Moltbot never sees a half-copied skill) and is then renamed into
+    # place; the old copy is deleted last, after the new one is live.
     skill_dest = moltbot_dir / "mimic_trigger"
+    skill_new = moltbot_dir / ".mimic_trigger.new"
+    skill_old = moltbot_dir / ".mimic_trigger.old"
+
+    # Nothing to do if the installed copy already matches
+    if not getattr(args, 'force', False) and trees_identical(skill_source, skill_dest):
+        print("✅ Mimic chat trigger skill is already up to date\n"
+              f"   Location: {skill_dest}\n"
+              "   (use --force to reinstall anyway)")
+        return
 
     try:
-        if skill_dest.exists():
-            shutil.rmtree(skill_dest)
-        shutil.copytree(skill_source, skill_dest)
+        # Leftovers from an interrupted install
+        for leftover in (skill_new, skill_old):
+            if leftover.exists():
+                shutil.rmtree(leftover)
 
-        print("✅ Mimic chat trigger skill installed!")
-        print(f"   Location: {skill_dest}")
-        print()
-        print("📱 You can now use these commands in Moltbot chat:")
-        print("   /mimic_start <task_name>  - Start recording")
-        print("   /mimic_stop               - Stop recording")
-        print("   /mimic_compile <name>     - Generate skill")
-        print("   /mimic_status             - Check recording status")
-        print()
-        print("💡 Tip: Run 'molt skills reload' to load the new skill immediately")
+        try:
+            copy_skill_tree(skill_source, skill_new)
+        except BaseException:
+            shutil.rmtree(skill_new, ignore_errors=True)
+            raise
+
+        # A non-empty directory can't be replaced in one step, so move the
+        # old one aside first
+        moved_aside = skill_dest.exists()
+        if moved_aside:
+            os.rename(skill_dest, skill_old)
+        try:
+            os.rename(skill_new, skill_dest)
+        except BaseException:
+            # Put the previous install back rather than leave none at all
+            if moved_aside:
+                os.rename(skill_old, skill_dest)
+            shutil.rmtree(skill_new, ignore_errors=True)
+            raise
+
+        # Delete the old copy while the result is printed. Not a daemon
+        # thread, so the process still waits for it before exiting.
+        if skill_old.exists():
+            threading.Thread(target=shutil.rmtree, args=(skill_old,), kwargs={"ignore_errors": True}).start()
 
     except PermissionError:
-        print(f"❌ Permission denied: {skill_dest}")
-        print("   Try running with appropriate permissions")
+        print(f"❌ Permission denied: {skill_dest}\n"
+              "   Try running with appropriate permissions")
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error installing skill: {e}")
         sys.exit(1)
 
+    # Written straight to the binary stdout when there is one (flushing
+    # anything already printed first, so the output stays in order)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is not None:
+        sys.stdout.flush()
+        out.write(INSTALL_BANNER_PREFIX + os.fsencode(skill_dest) + INSTALL_BANNER_SUFFIX)
+        out.flush()
+    else:
+        sys.stdout.write(INSTALL_BANNER_PREFIX.decode("utf-8") + str(skill_dest)
+                         + INSTALL_BANNER_SUFFIX.decode("utf-8"))
+
 
 def cmd_test(args):
     """Handle the 'test' command - verify Mimic setup and Moltbot integration."""
-    print("🔍 Mimic Integration Test")
-    print("=" * 40)
-    print()
+    # Output is collected and written in one go (a terminal is line-buffered,
+    # so each print would be a separate write). Not around
+    # get_moltbot_skills_dir(), which may prompt for the folder.
+    with buffered_stdout():
+        print("🔍 Mimic Integration Test")
+        print("=" * 40)
+        print()
 
-    # Check OS
-    system = platform.system()
-    print(f"✅ Operating System: {system}")
+        # Check OS
+        # sys.platform is a constant; platform.system() would call uname
+        system = {"linux": "Linux", "darwin": "Darwin", "win32": "Windows"}.get(sys.platform, sys.platform)
+        print(f"✅ Operating System: {system}")
 
-    # Check Python
-    print(f"✅ Python: {sys.version.split()[0]}")
+        # Check Python
+        print(f"✅ Python: {sys.version.split()[0]}")
 
-    # Check dependencies
-    print()
-    print("Dependencies:")
-    deps = ["mss", "pynput", "PIL", "anthropic"]
-    for dep in deps:
-        try:
-            __import__(dep if dep != "PIL" else "PIL")
-            print(f"   ✅ {dep}")
-        except ImportError:
-            print(f"   ❌ {dep} - not installed")
+        # Check dependencies
+        print()
+        print("Dependencies:")
+        # find_spec only locates each package rather than importing it, which
+        # for PIL and anthropic would load hundreds of modules
+        deps = ["mss", "pynput", "PIL", "anthropic"]
+        for dep in deps:
+            if importlib.util.find_spec(dep):
+                print(f"   ✅ {dep}")
+            else:
+                print(f"   ❌ {dep} - not installed")
 
-    # Check API key (with source detection)
-    print()
-    env_key = os.environ.get("ANTHROPIC_API_KEY")
-    if env_key:
-        masked = env_key[:10] + "..." + env_key[-4:] if len(env_key) > 14 else "***"
-        print(f"✅ API Key: {masked} (from environment)")
-    else:
-        # Try Moltbot config
-        moltbot_config = load_moltbot_config()
-        moltbot_key = None
-        if moltbot_config:
-            moltbot_key = moltbot_config.get("anthropic_api_key") or moltbot_config.get("api_key")
-            if not moltbot_key:
-                providers = moltbot_config.get("providers", {})
-                anthropic_cfg = providers.get("anthropic", {})
-                moltbot_key = anthropic_cfg.get("api_key")
-
-        if moltbot_key:
-            masked = moltbot_key[:10] + "..." + moltbot_key[-4:] if len(moltbot_key) > 14 else "***"
-            print(f"✅ API Key: {masked} (from Moltbot config)")
+        # Check API key (with source detection)
+        print()
+        moltbot_config = None
+        env_key = os.environ.get("ANTHROPIC_API_KEY")
+        if env_key:
+            masked = env_key[:10] + "..." + env_key[-4:] if len(env_key) > 14 else "***"
+            print(f"✅ API Key: {masked} (from environment)")
         else:
-            print("❌ API Key: Not found")
-            print("   Set via: export ANTHROPIC_API_KEY=...")
-            print("   Or: Moltbot will share its key automatically")
+            # Try Moltbot config
+            moltbot_config = load_moltbot_config()
+            moltbot_key = get_moltbot_api_key(moltbot_config)
 
-    api_key = get_api_key()  # For final status check
+            if moltbot_key:
+                masked = moltbot_key[:10] + "..." + moltbot_key[-4:] if len(moltbot_key) > 14 else "***"
+                print(f"✅ API Key: {masked} (from Moltbot config)")
+            else:
+                print("❌ API Key: Not found")
+                print("   Set via: export ANTHROPIC_API_KEY=...")
+                print("   Or: Moltbot will share its key automatically")
 
-    # Check Moltbot
-    print()
-    print("Moltbot Integration:")
-    default_path = get_default_moltbot_path()
-    print(f"   Default path: {default_path}")
+        api_key = get_api_key(moltbot_config)  # For final status check
 
-    config = load_config()
-    if "moltbot_skills_dir" in config:
-        print(f"   Config path: {config['moltbot_skills_dir']}")
+        # Check Moltbot
+        print()
+        print("Moltbot Integration:")
+        default_path = get_default_moltbot_path()
+        print(f"   Default path: {default_path}")
 
-    env_path = os.environ.get("MOLTBOT_SKILLS_DIR")
-    if env_path:
-        print(f"   Env var path: {env_path}")
+        config = load_config()
+        if "moltbot_skills_dir" in config:
+            print(f"   Config path: {config['moltbot_skills_dir']}")
+
+        env_path = os.environ.get("MOLTBOT_SKILLS_DIR")
+        if env_path:
+            print(f"   Env var path: {env_path}")
 
     # Check if folder exists
     moltbot_dir = get_moltbot_skills_dir()
-    if moltbot_dir:
-        valid, error = validate_moltbot_dir(moltbot_dir)
-        if valid:
-            print(f"   ✅ Skills folder: {moltbot_dir}")
 
-            # Count existing skills
-            if moltbot_dir.exists():
-                skills = [d for d in moltbot_dir.iterdir() if d.is_dir()]
+    with buffered_stdout():
+        if moltbot_dir:
+            valid, error = validate_moltbot_dir(moltbot_dir)
+            if valid:
+                print(f"   ✅ Skills folder: {moltbot_dir}")
+
+                # Count existing skills (scandir gets each entry's type from the
+                # directory listing; only symlinks need a stat). The folder
+                # exists - validate_moltbot_dir() just created or wrote to it.
+                with os.scandir(moltbot_dir) as entries:
+                    skills = [e.name for e in entries if e.is_dir()]
                 print(f"   ✅ Existing skills: {len(skills)}")
-        else:
-            print(f"   ❌ Error: {error}")
-
-    # Check accessibility support
-    print()
-    print("Accessibility (smarter skills):")
-    if ATSPI_AVAILABLE:
-        print("   ✅ AT-SPI available - element detection enabled")
-        print("   ℹ️  Clicks will capture button names, roles, etc.")
-    else:
-        print("   ⚠️  AT-SPI not available - using coordinates only")
-        print("   ℹ️  Install 'python3-pyatspi' for smarter skills")
+            else:
+                print(f"   ❌ Error: {error}")
 
-    # Show model info
-    print()
-    print("AI Model:")
-    model_config = get_model_config()
-    print(f"   Current: {model_config['description']}")
-    print(f"   Change with: mimic compile <name> --model opus")
-    print()
-    print("   Available models:")
-    for name, cfg in SUPPORTED_MODELS.items():
-        marker = "→" if name == DEFAULT_MODEL else " "
-        print(f"   {marker} {name}: {cfg['description']}")
+        # Check accessibility support
+        print()
+        print("Accessibility (smarter skills):")
+        if load_atspi():
+            print("   ✅ AT-SPI available - element detection enabled")
+            print("   ℹ️  Clicks will capture button names, roles, etc.")
+        else:
+            print("   ⚠️  AT-SPI not available - using coordinates only")
+            print("   ℹ️  Install 'python3-pyatspi' for smarter skills")
 
-    print()
-    print("=" * 40)
-    print("🎉 Mimic is ready!" if api_key else "⚠️  Set API key to compile skills")
+        # Show model info
+        print()
+        print("AI Model:")
+        model_config = get_model_config()
+        print(f"   Current: {model_config['description']}")
+        print(f"   Change with: mimic compile <name> --model opus")
+        print()
+        print("   Available models:")
+        print(MODEL_TABLE)
 
+        print()
+        print("=" * 40)
+        print("🎉 Mimic is ready!" if api_key else "⚠️  Set API key to compile skills")
 
-def main():
-    # Create the top-level parser
-    parser = argparse.ArgumentParser(
-        prog='mimic',
-        description='Record screen actions and generate automation skills for Moltbot'
-    )
 
-    # Create subcommand parsers
-    subparsers = parser.add_subparsers(
-        dest='command',
-        help='Available commands'
-    )
-
-    # 'start' command
-    start_parser = subparsers.add_parser(
-        'start',
-        help='Start recording a new task'
-    )
-    start_parser.add_argument(
+def add_start_arguments(parser):
+    """Arguments for the 'start' command."""
+    parser.add_argument(
         'name',
         type=str,
         help='Name for this task/skill (e.g., "open-browser", "fill-form")'
     )
-    start_parser.add_argument(
+    parser.add_argument(
         '-c', '--compile',
         action='store_true',
         help='Auto-compile to SKILL.md after recording stops'
     )
-    start_parser.add_argument(
+    parser.add_argument(
         '-p', '--privacy',
         action='store_true',
         help='Blur screenshots to protect sensitive information'
     )
-    start_parser.add_argument(
+    parser.add_argument(
         '-y', '--yes',
         action='store_true',
         help='Skip consent prompt (for scripted/automated use)'
     )
-    start_parser.set_defaults(func=cmd_start)
 
-    # 'stop' command
-    stop_parser = subparsers.add_parser(
-        'stop',
-        help='Stop recording and generate SKILL.md'
-    )
-    stop_parser.set_defaults(func=cmd_stop)
 
-    # 'status' command
-    status_parser = subparsers.add_parser(
-        'status',
-        help='Check recording status'
-    )
-    status_parser.set_defaults(func=cmd_status)
-
-    # 'compile' command
-    compile_parser = subparsers.add_parser(
-        'compile',
-        help='Send recording to Claude and generate SKILL.md'
-    )
-    compile_parser.add_argument(
+def add_compile_arguments(parser):
+    """Arguments for the 'compile' command."""
+    parser.add_argument(
         'name',
         type=str,
         help='Name of the recorded task to compile'
     )
-    compile_parser.add_argument(
+    parser.add_argument(
         '--cost-estimate',
         action='store_true',
         help='Show estimated API cost without compiling'
     )
-    compile_parser.add_argument(
+    parser.add_argument(
         '-m', '--model',
         type=str,
-        choices=['sonnet', 'opus', 'haiku'],
+        choices=MODEL_CHOICES,
         help='AI model to use: sonnet (default), opus (best), haiku (fast/cheap)'
     )
-    compile_parser.set_defaults(func=cmd_compile)
 
-    # 'test' command
-    test_parser = subparsers.add_parser(
-        'test',
-        help='Verify Mimic setup and Moltbot integration'
+
+def add_install_trigger_arguments(parser):
+    """Arguments for the 'install-trigger' command."""
+    parser.add_argument(
+        '-f', '--force',
+        action='store_true',
+        help='Reinstall even if the installed skill is already up to date'
     )
-    test_parser.set_defaults(func=cmd_test)
 
-    # 'install-trigger' command
-    install_parser = subparsers.add_parser(
-        'install-trigger',
-        help='Install chat trigger skill to Moltbot (enables /mimic_start from chat)'
+
+# Subcommands: name -> (help, handler, function adding its arguments)
+COMMANDS = {
+    'start': ('Start recording a new task', cmd_start, add_start_arguments),
+    'stop': ('Stop recording and generate SKILL.md', cmd_stop, None),
+    'status': ('Check recording status', cmd_status, None),
+    'compile': ('Send recording to Claude and generate SKILL.md', cmd_compile, add_compile_arguments),
+    'test': ('Verify Mimic setup and Moltbot integration', cmd_test, None),
+    'install-trigger': (
+        'Install chat trigger skill to Moltbot (enables /mimic_start from chat)',
+        cmd_install_trigger,
+        add_install_trigger_arguments
+    ),
+}
+
+
+def main():
+    # Create the top-level parser
+    parser = argparse.ArgumentParser(
+        prog='mimic',
+        description='Record screen actions and generate automation skills for Moltbot'
+    )
+
+    # Create subcommand parsers
+    subparsers = parser.add_subparsers(
+        dest='command',
+        help='Available commands'
     )
-    install_parser.set_defaults(func=cmd_install_trigger)
+
+    # Only the command being run needs its parser built. All of them are
+    # still needed for the top-level help and unknown-command errors.
+    requested = sys.argv[1] if len(sys.argv) > 1 else None
+    names = [requested] if requested in COMMANDS else COMMANDS
+
+    for name in names:
+        help_text, func, add_arguments = COMMANDS[name]
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(command_parser)
+        command_parser.set_defaults(func=func)
 
     # Parse arguments
     args = parser.parse_args()
@@ -1221,4 +1828,7 @@ def main():
 
 
 if __name__ == '__main__':
+    # Needed for the compile worker processes in PyInstaller builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()